@@ -1,10 +1,15 @@
 """The Equation Heaters integration."""
 from __future__ import annotations
 
+import asyncio
+from collections import defaultdict
+from functools import partial
+from time import monotonic
+
 from equationsdk.equation_api import ApiResponse, EquationAPI
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
 
 from .const import (
@@ -18,31 +23,31 @@ from .const import (
 from .coordinator import EquationDataUpdateCoordinator
 from .device_manager import EquationDeviceManager
 
+# Logged in API clients are reused for this long (in seconds) after their last use.
+AUTH_CACHE_TTL = 50 * 60
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Set up Equation Heaters from a config entry."""
+# Maximum time (in seconds) to wait for a login before retrying the setup later.
+LOGIN_TIMEOUT = 15
 
-    equation_api = EquationAPI(entry.data[CONF_USERNAME], entry.data[CONF_PASSWORD])
+# (username, installation_id) -> (logged in API client, last use timestamp).
+_AUTH_CACHE: dict[tuple[str, str], tuple[EquationAPI, float]] = {}
+# One lock per cache key, so a slow login only blocks entries sharing it.
+_AUTH_CACHE_LOCKS: defaultdict[tuple[str, str], asyncio.Lock] = defaultdict(
+    asyncio.Lock
+)
 
-    # Login to the Equation API.
-    login_result: ApiResponse = await hass.async_add_executor_job(
-        equation_api.initialize_authentication
-    )
 
-    if not login_result.success:
-        raise ConfigEntryNotReady("Unable to connect to the Equation API")
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Set up Equation Heaters from a config entry."""
 
-    equation_device_manager = EquationDeviceManager(
-        username=entry.data[CONF_USERNAME],
-        password=entry.data[CONF_PASSWORD],
-        installation_id=entry.data[CONF_INSTALLATION],
-        hass=hass,
-        equation_api=equation_api,
-    )
+    equation_coordinator = await _async_create_coordinator(hass, entry)
 
-    equation_coordinator = EquationDataUpdateCoordinator(hass, equation_device_manager)
+    try:
+        await equation_coordinator.async_config_entry_first_refresh()
+    except ConfigEntryNotReady:
+        _evict_cached_api(entry)
+        raise
 
-    await equation_coordinator.async_config_entry_first_refresh()
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = equation_coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -56,25 +61,30 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
 
+        if not hass.data[DOMAIN]:
+            hass.data.pop(DOMAIN, None)
+
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Forget the cached login of a removed config entry."""
+    _evict_cached_api(entry)
+
+
 async def init_device_manager(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> EquationDataUpdateCoordinator:
     """Initialize the device manager, API and coordinator."""
+    return await _async_create_coordinator(hass, entry)
 
-    equation_api = EquationAPI(entry.data[CONF_USERNAME], entry.data[CONF_PASSWORD])
 
-    LOGGER.debug("Device manager: Logging in")
-
-    # Login to the Equation API.
-    login_result: ApiResponse = await hass.async_add_executor_job(
-        equation_api.initialize_authentication
-    )
+async def _async_create_coordinator(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> EquationDataUpdateCoordinator:
+    """Log in to the Equation API and build the coordinator for an entry."""
 
-    if not login_result.success:
-        raise ConfigEntryNotReady("Unable to connect to the Equation API")
+    equation_api = await _async_get_api(hass, entry)
 
     equation_device_manager = EquationDeviceManager(
         username=entry.data[CONF_USERNAME],
@@ -82,6 +92,54 @@ async def init_device_manager(
         installation_id=entry.data[CONF_INSTALLATION],
         hass=hass,
         equation_api=equation_api,
+        on_auth_failure=partial(_evict_cached_api, entry),
     )
 
     return EquationDataUpdateCoordinator(hass, equation_device_manager)
+
+
+async def _async_get_api(hass: HomeAssistant, entry: ConfigEntry) -> EquationAPI:
+    """Return a logged in API client, reusing a cached session when still valid."""
+
+    cache_key = (entry.data[CONF_USERNAME], entry.data[CONF_INSTALLATION])
+
+    async with _AUTH_CACHE_LOCKS[cache_key]:
+        cached = _AUTH_CACHE.get(cache_key)
+
+        if cached and monotonic() - cached[1] < AUTH_CACHE_TTL:
+            LOGGER.debug("Device manager: Reusing cached login")
+            equation_api = cached[0]
+        else:
+            equation_api = EquationAPI(
+                entry.data[CONF_USERNAME], entry.data[CONF_PASSWORD]
+            )
+
+            LOGGER.debug("Device manager: Logging in")
+
+            # Login to the Equation API.
+            try:
+                async with asyncio.timeout(LOGIN_TIMEOUT):
+                    login_result: ApiResponse = await hass.async_add_executor_job(
+                        equation_api.initialize_authentication
+                    )
+            except TimeoutError as err:
+                _AUTH_CACHE.pop(cache_key, None)
+                raise ConfigEntryNotReady(
+                    "Timed out connecting to the Equation API"
+                ) from err
+
+            if not login_result.success:
+                _AUTH_CACHE.pop(cache_key, None)
+                raise ConfigEntryNotReady("Unable to connect to the Equation API")
+
+        # Refresh the timestamp on every use.
+        _AUTH_CACHE[cache_key] = (equation_api, monotonic())
+
+    return equation_api
+
+
+@callback
+def _evict_cached_api(entry: ConfigEntry) -> None:
+    """Drop the cached API client for a config entry."""
+    _AUTH_CACHE.pop((entry.data[CONF_USERNAME], entry.data[CONF_INSTALLATION]), None)
+
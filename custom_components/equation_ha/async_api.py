@@ -0,0 +1,197 @@
+"""Async read access to the Equation cloud API."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any
+
+import aiohttp
+from equationsdk.dto import EnergyConsumptionData
+from equationsdk.equation_api import ApiResponse, EquationAPI
+from equationsdk.settings import (
+    ENERGY_STATS_MAX_TRIES,
+    FIREBASE_DEFAULT_URL,
+    FIREBASE_DEVICE_ENERGY_PATH_BY_ID,
+    FIREBASE_DEVICES_PATH_BY_ID,
+    FIREBASE_GLOBAL_SETTINGS_PATH,
+    FIREBASE_INSTALLATIONS_PATH,
+)
+from equationsdk.utils import build_update_map
+
+from homeassistant.core import HomeAssistant
+
+HTTP_UNAUTHORIZED = 401
+
+
+class EquationAsyncAPI:
+    """Event loop based version of the SDK read calls.
+
+    The SDK performs blocking HTTP requests, which need an executor thread
+    each. The polling calls are reimplemented here on top of aiohttp, reusing
+    the login (and token refresh) of the SDK client.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        equation_api: EquationAPI,
+        session: aiohttp.ClientSession,
+        on_auth_failure: Callable[[], None] | None = None,
+    ) -> None:
+        """Initialize the API."""
+        self.hass = hass
+        self.equation_api = equation_api
+        self.session = session
+        self.on_auth_failure = on_auth_failure
+
+        self._auth_lock = asyncio.Lock()
+
+    async def _async_ensure_valid_auth(self) -> bool:
+        """Ensure the SDK client holds a valid authentication token."""
+
+        equation_api = self.equation_api
+        expire_date = equation_api.auth_token_expire_date
+
+        if equation_api.auth_token and expire_date and expire_date > datetime.now():
+            return True
+
+        async with self._auth_lock:
+            # The token refresh is rare, so it is left to the SDK.
+            auth_valid = bool(
+                await self.hass.async_add_executor_job(
+                    equation_api._ensure_valid_auth  # pylint: disable=protected-access
+                )
+            )
+
+        if not auth_valid:
+            self._auth_failed()
+
+        return auth_valid
+
+    def _auth_failed(self) -> None:
+        """Report that the login of the SDK client is no longer usable."""
+        if self.on_auth_failure is not None:
+            self.on_auth_failure()
+
+    async def _async_get(
+        self, name: str, url: str, params: dict[str, str] | None = None
+    ) -> ApiResponse:
+        """Send an authenticated GET request and return its JSON payload."""
+
+        if not await self._async_ensure_valid_auth():
+            return ApiResponse(False, None, "Invalid authentication.")
+
+        args = {"auth": self.equation_api.auth_token, **(params or {})}
+
+        try:
+            async with self.session.get(url, params=args) as response:
+                if response.status == HTTP_UNAUTHORIZED:
+                    self._auth_failed()
+
+                if response.status != 200:
+                    return ApiResponse(False, None, f"{name}() returned {response.status}")
+
+                return ApiResponse(True, await response.json(content_type=None), None)
+        except aiohttp.ClientError as err:
+            return ApiResponse(False, None, f"Network error {err}")
+
+    async def async_get_installation_devices(self, installation_id: str) -> ApiResponse:
+        """Retrieve all devices present in an installation."""
+
+        response = await self._async_get(
+            "get_installation_by_id",
+            f"{FIREBASE_DEFAULT_URL}{FIREBASE_INSTALLATIONS_PATH}",
+            {"orderBy": '"userid"', "equalTo": f'"{self.equation_api.local_id}"'},
+        )
+
+        if not response.success:
+            return response
+
+        if not response.data or installation_id not in response.data:
+            return ApiResponse(False, None, "No Equation installation found.")
+
+        detected_devices: list[str] = []
+
+        for zone_data in response.data[installation_id]["zones"].values():
+            detected_devices.extend(_extract_devices(zone_data))
+
+        return ApiResponse(True, detected_devices, None)
+
+    async def async_get_latest_firmware(self) -> ApiResponse:
+        """Retrieve the latest firmware available for each device type."""
+
+        response = await self._async_get(
+            "get_latest_firmware",
+            f"{FIREBASE_DEFAULT_URL}{FIREBASE_GLOBAL_SETTINGS_PATH}",
+        )
+
+        if not response.success:
+            return response
+
+        if not response.data:
+            return ApiResponse(False, None, "Global Settings is empty.")
+
+        return ApiResponse(True, build_update_map(response.data), None)
+
+    async def async_get_device(self, device_id: str) -> ApiResponse:
+        """Retrieve device data."""
+
+        return await self._async_get(
+            "get_device",
+            f"{FIREBASE_DEFAULT_URL}{FIREBASE_DEVICES_PATH_BY_ID.format(device_id)}",
+        )
+
+    async def async_get_latest_energy_stats(self, device_id: str) -> ApiResponse:
+        """Retrieve the latest energy consumption values.
+
+        Stats are stored per hour. If the current hour has none yet, go back
+        one hour at a time, up to the SDK's maximum number of tries.
+        """
+
+        target_date = datetime.now().replace(minute=0, second=0, microsecond=0)
+
+        for _ in range(ENERGY_STATS_MAX_TRIES):
+            url = "{}{}{}/energy/{}0000.json".format(
+                FIREBASE_DEFAULT_URL,
+                FIREBASE_DEVICE_ENERGY_PATH_BY_ID.format(device_id),
+                target_date.strftime("%Y/%m/%d"),
+                target_date.strftime("%H"),
+            )
+
+            response = await self._async_get("_retrieve_hour_energy_stats", url)
+
+            if not response.success:
+                return response
+
+            if response.data:
+                return ApiResponse(
+                    True,
+                    EnergyConsumptionData(
+                        created=datetime.now,
+                        start=target_date,
+                        end=target_date + timedelta(hours=1),
+                        kwh=float(response.data["kw_h"]),
+                        effective_power=float(response.data["effective_power"]),
+                    ),
+                    None,
+                )
+
+            target_date -= timedelta(hours=1)
+
+        return ApiResponse(False, None, "Max tries exceeded.")
+
+
+def _extract_devices(zone_data: dict[str, Any] | None) -> list[str]:
+    """Return the device IDs of a zone and its sub zones."""
+
+    if not zone_data:
+        return []
+
+    zone_devices: list[str] = list(zone_data.get("devices") or {})
+
+    for sub_zone_data in (zone_data.get("zones") or {}).values():
+        zone_devices.extend(_extract_devices(sub_zone_data))
+
+    return zone_devices
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from abc import ABC
 import asyncio
+from collections.abc import Callable
+from datetime import datetime
+from time import monotonic
 
 from equationsdk.device import EquationDevice
 
@@ -18,9 +20,10 @@ from homeassistant.components.climate import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 
 from .const import (
     CMD_SET_HVAC_MODE,
@@ -41,6 +44,26 @@ from .const import (
 from .coordinator import EquationDataUpdateCoordinator
 from .equation_entity import EquationRadiatorEntity
 
+# Radiator preset -> Home Assistant preset.
+_PRESET_TO_HA = {
+    RADIATOR_PRESET_ECO: PRESET_ECO,
+    RADIATOR_PRESET_COMFORT: PRESET_COMFORT,
+    RADIATOR_PRESET_ICE: PRESET_EQUATION_ICE,
+}
+
+# Radiator preset -> device attribute holding its target temperature.
+_PRESET_TO_TEMP_ATTR = {
+    RADIATOR_PRESET_ECO: "eco_temp",
+    RADIATOR_PRESET_COMFORT: "comfort_temp",
+    RADIATOR_PRESET_ICE: "ice_temp",
+}
+
+# Seconds during which locally applied command results win over coordinator data.
+OPTIMISTIC_STATE_HOLD = 5.0
+
+# Delay before each power attempt; the first one is sent right away.
+POWER_RETRY_BACKOFF = (0.0, 0.25, 0.5)
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -52,9 +75,21 @@ async def async_setup_entry(
     )
 
 
-class EquationHaClimate(EquationRadiatorEntity, ClimateEntity, ABC):
+class EquationHaClimate(EquationRadiatorEntity, ClimateEntity):
     """Climate entity."""
 
+    _attr_supported_features = (
+        ClimateEntityFeature.TARGET_TEMPERATURE
+        | ClimateEntityFeature.PRESET_MODE
+        | ClimateEntityFeature.TURN_ON
+        | ClimateEntityFeature.TURN_OFF
+    )
+    _attr_hvac_modes = (HVACMode.OFF, HVACMode.HEAT, HVACMode.AUTO)
+    _attr_preset_modes = (PRESET_COMFORT, PRESET_ECO, PRESET_EQUATION_ICE)
+    _attr_temperature_unit = UnitOfTemperature.CELSIUS
+    _attr_target_temperature_step = RADIATOR_TEMP_STEP
+    _attr_icon = "mdi:radiator"
+
     def __init__(
         self,
         radiator: EquationDevice,
@@ -74,210 +109,264 @@ class EquationHaClimate(EquationRadiatorEntity, ClimateEntity, ABC):
         self._last_target_temperature: float | None = None
         self._last_preset_mode: str | None = None
 
+        # Coordinator updates keep the optimistic state until this timestamp.
+        self._optimistic_until: float = 0.0
+        # Applies the updates held back once the optimistic hold ends.
+        self._cancel_optimistic_hold: Callable[[], None] | None = None
+
+        # Radiator state that was last written to Home Assistant.
+        self._last_signature: tuple | None = None
+
+        self._update_attrs()
+
     # ---------------------------------------------------------------------
-    # Properties
+    # State
     # ---------------------------------------------------------------------
 
-    @property
-    def icon(self) -> str | None:
-        return "mdi:radiator"
-
-    @property
-    def temperature_unit(self) -> str:
-        return UnitOfTemperature.CELSIUS
-
-    @property
-    def target_temperature(self) -> float:
-        if self._radiator.mode == RADIATOR_MODE_MANUAL:
-            if self._radiator.preset == RADIATOR_PRESET_ECO:
-                return self._radiator.eco_temp
-            if self._radiator.preset == RADIATOR_PRESET_COMFORT:
-                return self._radiator.comfort_temp
-            if self._radiator.preset == RADIATOR_PRESET_ICE:
-                return self._radiator.ice_temp
-
-        return self._radiator.temp
-
-    @property
-    def current_temperature(self) -> float:
-        return self._radiator.temp_probe
-
-    @property
-    def max_temp(self) -> float:
-        if self._radiator.user_mode_supported and self._radiator.user_mode:
-            return self._radiator.um_max_temp
-        return RADIATOR_TEMP_MAX
-
-    @property
-    def min_temp(self) -> float:
-        if self._radiator.user_mode_supported and self._radiator.user_mode:
-            return self._radiator.um_min_temp
-        return RADIATOR_TEMP_MIN
-
-    @property
-    def target_temperature_high(self) -> float:
-        return self.max_temp
-
-    @property
-    def target_temperature_low(self) -> float:
-        return self.min_temp
-
-    @property
-    def supported_features(self) -> ClimateEntityFeature:
+    @callback
+    def _update_attrs(self) -> None:
+        """Compute the cached entity attributes from the radiator state."""
+        radiator = self._radiator
+
+        if radiator.user_mode_supported and radiator.user_mode:
+            self._attr_max_temp = radiator.um_max_temp
+            self._attr_min_temp = radiator.um_min_temp
+        else:
+            self._attr_max_temp = RADIATOR_TEMP_MAX
+            self._attr_min_temp = RADIATOR_TEMP_MIN
+
+        self._attr_target_temperature_high = self._attr_max_temp
+        self._attr_target_temperature_low = self._attr_min_temp
+        self._attr_current_temperature = radiator.temp_probe
+
+        preset = radiator.preset
+        mode = radiator.mode
+
+        if mode == RADIATOR_MODE_MANUAL and (
+            temp_attr := _PRESET_TO_TEMP_ATTR.get(preset)
+        ):
+            self._attr_target_temperature = getattr(radiator, temp_attr)
+        else:
+            self._attr_target_temperature = radiator.temp
+
+        if not radiator.power:
+            self._attr_hvac_mode = HVACMode.OFF
+            self._attr_hvac_action = HVACAction.OFF
+        else:
+            if mode == RADIATOR_MODE_AUTO:
+                self._attr_hvac_mode = HVACMode.AUTO
+            else:
+                self._attr_hvac_mode = HVACMode.HEAT
+            self._attr_hvac_action = HVACAction.HEATING
+
+        self._attr_preset_mode = _PRESET_TO_HA.get(preset)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel the pending end of the optimistic hold."""
+        if self._cancel_optimistic_hold:
+            self._cancel_optimistic_hold()
+            self._cancel_optimistic_hold = None
+
+        await super().async_will_remove_from_hass()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        if monotonic() >= self._optimistic_until:
+            self._write_state_if_changed()
+
+    def _state_signature(self) -> tuple:
+        """Return the radiator values that the entity state is derived from.
+
+        Every value read by `_update_attrs` must be part of it, otherwise a
+        change of that value alone would never be written.
+        """
+        radiator = self._radiator
         return (
-            ClimateEntityFeature.TARGET_TEMPERATURE
-            | ClimateEntityFeature.PRESET_MODE
-            | ClimateEntityFeature.TURN_ON
-            | ClimateEntityFeature.TURN_OFF
+            self.available,
+            radiator.power,
+            radiator.mode,
+            radiator.preset,
+            radiator.temp,
+            radiator.temp_probe,
+            radiator.comfort_temp,
+            radiator.eco_temp,
+            radiator.ice_temp,
+            radiator.user_mode,
+            # The user mode limits only exist on devices supporting it.
+            getattr(radiator, "um_max_temp", None),
+            getattr(radiator, "um_min_temp", None),
         )
 
-    @property
-    def target_temperature_step(self) -> float | None:
-        return RADIATOR_TEMP_STEP
-
-    @property
-    def hvac_modes(self) -> list[str]:
-        return [HVACMode.OFF, HVACMode.HEAT, HVACMode.AUTO]
-
-    @property
-    def preset_modes(self) -> list[str]:
-        return [PRESET_COMFORT, PRESET_ECO, PRESET_EQUATION_ICE]
-
-    @property
-    def hvac_mode(self) -> str:
-        if not self._radiator.power:
-            return HVACMode.OFF
-        if self._radiator.mode == RADIATOR_MODE_AUTO:
-            return HVACMode.AUTO
-        return HVACMode.HEAT
-
-    @property
-    def hvac_action(self) -> str:
-        if not self._radiator.power:
-            return HVACAction.OFF
-        return HVACAction.HEATING
-
-    @property
-    def preset_mode(self) -> str | None:
-        if self._radiator.preset == RADIATOR_PRESET_ECO:
-            return PRESET_ECO
-        if self._radiator.preset == RADIATOR_PRESET_COMFORT:
-            return PRESET_COMFORT
-        if self._radiator.preset == RADIATOR_PRESET_ICE:
-            return PRESET_EQUATION_ICE
-        return None
+    @callback
+    def _write_state_if_changed(self) -> None:
+        """Refresh the cached attributes and write the state only if it changed."""
+        signature = self._state_signature()
+
+        if signature == self._last_signature:
+            return
+
+        self._last_signature = signature
+        self._update_attrs()
+        self.async_write_ha_state()
 
     # ---------------------------------------------------------------------
     # Commands
     # ---------------------------------------------------------------------
 
     async def async_set_temperature(self, **kwargs):
-        temperature = float(kwargs["temperature"])
+        await self._async_send_temperature(float(kwargs["temperature"]))
+        self._signal_thermostat_update()
+
+    async def async_set_preset_mode(self, preset_mode):
+        await self._async_send_preset_mode(preset_mode)
+        self._signal_thermostat_update()
+
+    async def _async_send_temperature(self, temperature: float) -> None:
+        """Send a target temperature without refreshing the entity state."""
+        radiator = self._radiator
         self._last_target_temperature = temperature
         self._last_preset_mode = None
 
         if not await self.device_manager.send_command(
-            self._radiator, CMD_SET_TEMP, temperature
+            radiator, CMD_SET_TEMP, temperature
         ):
             raise HomeAssistantError(
-                f"Failed to set temperature for {self._radiator.name}"
+                f"Failed to set temperature for {radiator.name}"
             )
 
-        await self._signal_thermostat_update()
-
-    async def async_set_preset_mode(self, preset_mode):
+    async def _async_send_preset_mode(self, preset_mode: str) -> None:
+        """Send a preset mode without refreshing the entity state."""
+        radiator = self._radiator
         self._last_preset_mode = preset_mode
         self._last_target_temperature = None
 
         if not await self.device_manager.send_command(
-            self._radiator, CMD_SET_PRESET, preset_mode
+            radiator, CMD_SET_PRESET, preset_mode
         ):
             raise HomeAssistantError(
-                f"Failed to set preset mode for {self._radiator.name}"
+                f"Failed to set preset mode for {radiator.name}"
             )
 
-        await self._signal_thermostat_update()
-
     # ---------------------------------------------------------------------
     # FORCE ON / OFF (the important part)
     # ---------------------------------------------------------------------
 
     async def async_turn_off(self):
         """Force turn off radiator (retry until confirmed)."""
-        LOGGER.warning("FORCING OFF radiator %s", self._radiator.name)
+        radiator = self._radiator
+
+        if not radiator.power:
+            self._write_state_if_changed()
+            return
+
+        LOGGER.warning("FORCING OFF radiator %s", radiator.name)
 
         self._last_hvac_mode = self.hvac_mode
         self._last_target_temperature = self.target_temperature
         self._last_preset_mode = self.preset_mode
 
-        for attempt in range(1, 4):
-            await self.device_manager.send_command(
-                self._radiator, CMD_SET_HVAC_MODE, HVACMode.OFF
-            )
-
-            await asyncio.sleep(2)
-            await self.coordinator.async_request_refresh()
+        for attempt, backoff in enumerate(POWER_RETRY_BACKOFF, start=1):
+            await asyncio.sleep(backoff)
 
-            if not self._radiator.power:
+            if await self._async_confirm_power(HVACMode.OFF, False):
                 LOGGER.info(
                     "Radiator %s turned OFF (attempt %s)",
-                    self._radiator.name,
+                    radiator.name,
                     attempt,
                 )
-                self.async_write_ha_state()
+                self._write_state_if_changed()
                 return
 
             LOGGER.warning(
                 "Radiator %s still ON after OFF attempt %s",
-                self._radiator.name,
+                radiator.name,
                 attempt,
             )
 
         raise HomeAssistantError(
-            f"Failed to turn off radiator {self._radiator.name}"
+            f"Failed to turn off radiator {radiator.name}"
         )
 
     async def async_turn_on(self):
         """Force turn on radiator (retry until confirmed)."""
-        LOGGER.warning("FORCING ON radiator %s", self._radiator.name)
+        radiator = self._radiator
 
-        hvac_mode = self._last_hvac_mode or HVACMode.HEAT
+        if radiator.power:
+            self._write_state_if_changed()
+            return
 
-        for attempt in range(1, 4):
-            await self.device_manager.send_command(
-                self._radiator, CMD_SET_HVAC_MODE, hvac_mode
-            )
+        LOGGER.warning("FORCING ON radiator %s", radiator.name)
 
-            await asyncio.sleep(2)
-            await self.coordinator.async_request_refresh()
+        hvac_mode = self._last_hvac_mode or HVACMode.HEAT
 
-            if self._radiator.power:
+        for attempt, backoff in enumerate(POWER_RETRY_BACKOFF, start=1):
+            await asyncio.sleep(backoff)
+
+            if await self._async_confirm_power(hvac_mode, True):
                 LOGGER.info(
                     "Radiator %s turned ON (attempt %s)",
-                    self._radiator.name,
+                    radiator.name,
                     attempt,
                 )
 
+                # Restore the previous setpoint with a single state write.
                 if self._last_preset_mode:
-                    await self.async_set_preset_mode(self._last_preset_mode)
+                    await self._async_send_preset_mode(self._last_preset_mode)
+                    self._signal_thermostat_update()
                 elif self._last_target_temperature is not None:
-                    await self.async_set_temperature(
-                        temperature=self._last_target_temperature
-                    )
+                    await self._async_send_temperature(self._last_target_temperature)
+                    self._signal_thermostat_update()
+                else:
+                    self._write_state_if_changed()
 
-                self.async_write_ha_state()
                 return
 
             LOGGER.warning(
                 "Radiator %s still OFF after ON attempt %s",
-                self._radiator.name,
+                radiator.name,
                 attempt,
             )
 
         raise HomeAssistantError(
-            f"Failed to turn on radiator {self._radiator.name}"
+            f"Failed to turn on radiator {radiator.name}"
         )
 
-    async def _signal_thermostat_update(self):
-        await self.coordinator.async_request_refresh()
-        self.async_write_ha_state()
+    async def _async_confirm_power(self, hvac_mode: str, power: bool) -> bool:
+        """Send an hvac mode and check that the cloud reports the given power.
+
+        The command already applies the power to the device model, so the
+        radiator is fetched again and only its cloud state counts.
+        """
+        device_manager = self.device_manager
+        radiator = self._radiator
+
+        # The device model may hold the power of a failed attempt, always send.
+        await device_manager.send_command(
+            radiator, CMD_SET_HVAC_MODE, hvac_mode, force=True
+        )
+
+        if not await device_manager.async_refresh_device(radiator):
+            return False
+
+        return radiator.power == power
+
+    @callback
+    def _signal_thermostat_update(self) -> None:
+        """Write the locally applied command result without polling the cloud."""
+        self._optimistic_until = monotonic() + OPTIMISTIC_STATE_HOLD
+        self._write_state_if_changed()
+
+        if self._cancel_optimistic_hold:
+            self._cancel_optimistic_hold()
+
+        self._cancel_optimistic_hold = async_call_later(
+            self.hass, OPTIMISTIC_STATE_HOLD, self._end_optimistic_hold
+        )
+
+    @callback
+    def _end_optimistic_hold(self, _now: datetime) -> None:
+        """Write the coordinator data polled during the optimistic hold."""
+        self._cancel_optimistic_hold = None
+        self._optimistic_until = 0.0
+        self._write_state_if_changed()
@@ -15,7 +15,7 @@ CONF_INSTALLATION = "equation_installation"
 
 EQUATION_MANUFACTURER = "Equation"
 
-EQUATION_SUPPORTED_DEVICES = ["radiator", "towel", "therm"]
+EQUATION_SUPPORTED_DEVICES = frozenset({"radiator", "towel", "therm"})
 
 CMD_SET_TEMP = "cmd_set_temp"
 CMD_SET_PRESET = "cmd_set_preset"
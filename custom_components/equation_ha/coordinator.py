@@ -1,6 +1,7 @@
 """Provides the Equation DataUpdateCoordinator."""
 from __future__ import annotations
 
+from collections.abc import Callable
 from datetime import timedelta
 from typing import Any
 
@@ -29,6 +30,9 @@ class EquationDataUpdateCoordinator(DataUpdateCoordinator[dict[str, EquationDevi
         self.device_manager = device_manager
         self.unregistered_keys: dict[str, dict[str, EquationDevice]] = {}
 
+        # device_id -> keys of the added sensors that need energy data.
+        self._energy_enabled: dict[str, set[str]] = {}
+
         super().__init__(
             hass,
             LOGGER,
@@ -41,7 +45,7 @@ class EquationDataUpdateCoordinator(DataUpdateCoordinator[dict[str, EquationDevi
     async def _async_update_data(self) -> dict[str, EquationDevice]:
         """Fetch data from API."""
 
-        new_devices = await self.device_manager.update()
+        new_devices = await self.device_manager.update(self._energy_enabled)
 
         for platform in PLATFORMS:
             self.unregistered_keys[platform].update(
@@ -57,6 +61,27 @@ class EquationDataUpdateCoordinator(DataUpdateCoordinator[dict[str, EquationDevi
 
         return new_devices
 
+    @callback
+    def async_enable_energy_data(
+        self, device_id: str, sensor_key: str
+    ) -> Callable[[], None]:
+        """Retrieve energy data for a device while a sensor is using it.
+
+        Returns a callback that stops requesting it for that sensor.
+        """
+
+        self._energy_enabled.setdefault(device_id, set()).add(sensor_key)
+
+        @callback
+        def _disable() -> None:
+            sensor_keys = self._energy_enabled.get(device_id, set())
+            sensor_keys.discard(sensor_key)
+
+            if not sensor_keys:
+                self._energy_enabled.pop(device_id, None)
+
+        return _disable
+
     @callback
     def add_entities_for_seen_keys(
         self,
@@ -95,7 +120,7 @@ class EquationDataUpdateCoordinator(DataUpdateCoordinator[dict[str, EquationDevi
     def add_sensor_entities_for_seen_keys(
         self,
         async_add_entities: AddEntitiesCallback,
-        sensor_descriptions: list[EquationSensorEntityDescription],
+        sensor_descriptions: tuple[EquationSensorEntityDescription, ...],
         sensor_constructor: type,
     ) -> None:
         """Add entities for new sensors from a list of entity descriptions."""
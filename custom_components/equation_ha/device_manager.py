@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable, Container
 from datetime import datetime
+import logging
+from math import isclose
+from time import monotonic
 from typing import Any
 
 from equationsdk.device import EquationDevice, ScheduleMode
@@ -14,7 +18,9 @@ from equationsdk.utils import get_product_by_type_version
 
 from homeassistant.components.climate import PRESET_COMFORT, PRESET_ECO, HVACMode
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
 
+from .async_api import EquationAsyncAPI
 from .const import (
     CMD_SET_HVAC_MODE,
     CMD_SET_PRESET,
@@ -22,6 +28,7 @@ from .const import (
     LOGGER,
     PRESET_EQUATION_ICE,
     RADIATOR_DEFAULT_TEMPERATURE,
+    RADIATOR_MODE_AUTO,
     RADIATOR_MODE_MANUAL,
     RADIATOR_PRESET_COMFORT,
     RADIATOR_PRESET_ECO,
@@ -30,6 +37,23 @@ from .const import (
     EQUATION_SUPPORTED_DEVICES,
 )
 
+# Maximum number of commands sent to the Equation API at the same time.
+COMMAND_CONCURRENCY = 5
+
+# Maximum number of devices polled at the same time.
+DEVICE_FETCH_CONCURRENCY = 8
+# Maximum time (in seconds) to retrieve the base data of a single device.
+DEVICE_FETCH_TIMEOUT = 10
+# Maximum time (in seconds) to retrieve the energy data of a single device, which
+# can take several requests when the latest hours have no stats yet.
+ENERGY_FETCH_TIMEOUT = 20
+
+# Temperatures closer than this (in degrees) are considered equal.
+TEMP_TOLERANCE = 0.01
+
+# The firmware catalog changes on vendor release cadence, refetch it every 6 hours.
+FIRMWARE_MAP_TTL = 6 * 60 * 60
+
 
 def determine_latest_firmware(
     device_data: dict[str, Any], fw_map: dict[EquationProduct, dict[str, str]]
@@ -39,11 +63,13 @@ def determine_latest_firmware(
     if not device_data or "data" not in device_data:
         return None
 
-    product_type = device_data["data"].get("type", None)
-    version = device_data["data"].get("product_version", None)
-    current_firmware = device_data["firmware"].get("firmware_version_device", None)
+    data = device_data["data"] or {}
+    firmware = device_data.get("firmware") or {}
+    product_type = data.get("type")
+    version = data.get("product_version")
+    current_firmware = firmware.get("firmware_version_device")
 
-    if not any((product_type, version, current_firmware)):
+    if not (product_type and version and current_firmware):
         LOGGER.warning(
             "Unable to determine latest FW for [%s][%s] at v[%s]",
             product_type,
@@ -68,6 +94,30 @@ def determine_latest_firmware(
     return current_firmware
 
 
+def _is_hvac_mode_active(device: EquationDevice, hvac_mode: str) -> bool:
+    """Return True if the device already runs in the given hvac mode."""
+
+    if hvac_mode == HVACMode.OFF:
+        return not device.power
+
+    if hvac_mode == HVACMode.HEAT:
+        return (
+            device.power
+            and device.mode == RADIATOR_MODE_MANUAL
+            and device.preset == RADIATOR_PRESET_NONE
+        )
+
+    if hvac_mode == HVACMode.AUTO:
+        return device.power and device.mode == RADIATOR_MODE_AUTO
+
+    return False
+
+
+def _failed_response(err: Exception) -> ApiResponse:
+    """Wrap an exception raised while calling the API into a failed response."""
+    return ApiResponse(False, None, repr(err))
+
+
 class EquationDeviceManager:
     """Device Manager."""
 
@@ -78,6 +128,7 @@ class EquationDeviceManager:
         installation_id: str,
         hass: HomeAssistant,
         equation_api: EquationAPI,
+        on_auth_failure: Callable[[], None] | None = None,
     ) -> None:
         """Initialize the device manager."""
         self.username = username
@@ -86,11 +137,30 @@ class EquationDeviceManager:
         self.equation_api = equation_api
 
         self.hass = hass
+        # Dedicated session reused across polls, closed by Home Assistant when
+        # the entry unloads or fails to set up, and at shutdown.
+        self._session = async_create_clientsession(hass)
+        self.async_api = EquationAsyncAPI(
+            hass, equation_api, self._session, on_auth_failure
+        )
+
+        # Blocking SDK calls run in the executor, bound once here.
+        self._api_set_device_temp = equation_api.set_device_temp
+        self._api_set_device_mode = equation_api.set_device_mode
+        self._api_set_device_preset = equation_api.set_device_preset
         self.auth_token = None
         self.auth_token_expire_date: datetime | None = None
 
         self.equation_devices: dict[str, EquationDevice] = {}
 
+        self._command_semaphore = asyncio.Semaphore(COMMAND_CONCURRENCY)
+        self._fetch_semaphore = asyncio.Semaphore(DEVICE_FETCH_CONCURRENCY)
+
+        # (fetch timestamp, firmware map) of the last successful firmware fetch.
+        self._fw_map_cache: tuple[
+            float, dict[EquationProduct, dict[str, str]]
+        ] | None = None
+
     def _fail_all_devices(self):
         """Set all devices as unavailable."""
 
@@ -98,18 +168,24 @@ class EquationDeviceManager:
             for device in self.equation_devices.values():
                 device.hass_available = False
 
-    async def update(self) -> dict[str, list[EquationDevice]]:
+    async def update(
+        self, energy_device_ids: Container[str]
+    ) -> dict[str, EquationDevice]:
         """Retrieve the devices from the user's installation.
 
-        Returns a list of newly discovered devices.
+        Energy data is only retrieved for new devices and the ones listed in
+        `energy_device_ids`.
+
+        Returns the newly discovered devices, by device ID.
         """
 
-        LOGGER.debug("Device manager updating")
+        debug_enabled = LOGGER.isEnabledFor(logging.DEBUG)
+
+        if debug_enabled:
+            LOGGER.debug("Device manager updating")
 
         installation_devices_response: ApiResponse = (
-            await self.hass.async_add_executor_job(
-                self.equation_api.get_installation_devices, self.installation_id
-            )
+            await self.async_api.async_get_installation_devices(self.installation_id)
         )
 
         if not installation_devices_response.success:
@@ -121,60 +197,53 @@ class EquationDeviceManager:
             return {}
 
         user_device_ids: list[str] = installation_devices_response.data
-        discovered_devices: dict[str, list[EquationDevice]] = {}
+        discovered_devices: dict[str, EquationDevice] = {}
 
-        # device_id -> (base data future, energy data future)
-        device_data_futures: dict[str, tuple[asyncio.Future, asyncio.Future]] = {}
-        pending_futures: list[asyncio.Future] = []
+        # The firmware map is only used to process devices.
+        if not user_device_ids:
+            return discovered_devices
 
-        # Firmware data.
-        firmware_map_future: asyncio.Future = self.hass.async_add_executor_job(
-            self.equation_api.get_latest_firmware
+        fetch_firmware = (
+            self._fw_map_cache is None
+            or monotonic() - self._fw_map_cache[0] > FIRMWARE_MAP_TTL
         )
-        pending_futures.append(firmware_map_future)
-
-        # Dispatch API calls for all devices, in all zones. Each device requires a call
-        # to retrieve its base data and another one for energy data.
-        for device_id in user_device_ids:
-            LOGGER.debug("Found device ID: %s", device_id)
-            futures = (
-                self.hass.async_add_executor_job(self.equation_api.get_device, device_id),
-                self.hass.async_add_executor_job(
-                    self.equation_api.get_latest_energy_stats, device_id
-                ),
+
+        # Dispatch API calls for all devices, in all zones, along with the firmware
+        # data when the cached one expired. Each device requires a call to retrieve
+        # its base data and another one for energy data.
+        pending_requests = [
+            self._async_fetch_device(
+                device_id,
+                device_id in energy_device_ids
+                or device_id not in self.equation_devices,
             )
+            for device_id in user_device_ids
+        ]
 
-            pending_futures.extend([futures[0], futures[1]])
-            device_data_futures[device_id] = futures
+        if fetch_firmware:
+            pending_requests.append(self.async_api.async_get_latest_firmware())
 
-        # Gather all futures.
-        await asyncio.gather(*pending_futures)
+        device_responses = await asyncio.gather(
+            *pending_requests, return_exceptions=True
+        )
 
         # Firmware data result.
-        firmware_map_response: ApiResponse = firmware_map_future.result()
-
-        if firmware_map_response.success and firmware_map_response.data:
-            firmware_map: dict[
-                EquationProduct, dict[str, str]
-            ] | None = firmware_map_response.data
+        if fetch_firmware:
+            firmware_map = self._store_firmware_map(device_responses.pop())
         else:
-            LOGGER.error(
-                "Unable to fetch firmware map: %s",
-                firmware_map_response.error_message,
-            )
-            firmware_map = None
-
-        # Process all completed device data futures.
-        for device_id, device_futures in device_data_futures.items():
-            base_data_response: ApiResponse = device_futures[0].result()
-            energy_data_response: ApiResponse = device_futures[1].result()
-
-            if not base_data_response.success:
-                LOGGER.warning(
-                    "Failed getting device status for %s. Error: %s",
-                    device_id,
-                    base_data_response.error_message,
+            firmware_map = self._fw_map_cache[1]
+
+        # Process all device data responses.
+        for device_id, device_response in zip(user_device_ids, device_responses):
+            if debug_enabled:
+                LOGGER.debug("Found device ID: %s", device_id)
+
+            if isinstance(device_response, Exception):
+                base_data_response = energy_data_response = _failed_response(
+                    device_response
                 )
+            else:
+                base_data_response, energy_data_response = device_response
 
             new_device = await self._process_api_data(
                 base_data_response, device_id, energy_data_response, firmware_map
@@ -182,20 +251,113 @@ class EquationDeviceManager:
 
             if new_device:
                 self.equation_devices[device_id] = new_device
-                discovered_devices[new_device.id] = new_device
+                discovered_devices[device_id] = new_device
 
         return discovered_devices
 
+    def _store_firmware_map(
+        self, firmware_map_response: ApiResponse | Exception
+    ) -> dict[EquationProduct, dict[str, str]] | None:
+        """Cache a fetched firmware map, falling back to the cached one on errors."""
+
+        if isinstance(firmware_map_response, Exception):
+            firmware_map_response = _failed_response(firmware_map_response)
+
+        if firmware_map_response.success and firmware_map_response.data:
+            self._fw_map_cache = (monotonic(), firmware_map_response.data)
+            return firmware_map_response.data
+
+        LOGGER.error(
+            "Unable to fetch firmware map: %s",
+            firmware_map_response.error_message,
+        )
+
+        return self._fw_map_cache[1] if self._fw_map_cache else None
+
+    async def _async_fetch_device(
+        self, device_id: str, fetch_energy: bool
+    ) -> tuple[ApiResponse, ApiResponse | None]:
+        """Retrieve the base data of a device, and its energy data if requested.
+
+        Each request has its own timeout. A failed energy lookup only leaves
+        out the energy data, keeping the device available.
+        """
+
+        async with self._fetch_semaphore:
+            if not fetch_energy:
+                return (
+                    await asyncio.wait_for(
+                        self.async_api.async_get_device(device_id),
+                        DEVICE_FETCH_TIMEOUT,
+                    ),
+                    None,
+                )
+
+            base_data_response, energy_data_response = await asyncio.gather(
+                asyncio.wait_for(
+                    self.async_api.async_get_device(device_id), DEVICE_FETCH_TIMEOUT
+                ),
+                asyncio.wait_for(
+                    self.async_api.async_get_latest_energy_stats(device_id),
+                    ENERGY_FETCH_TIMEOUT,
+                ),
+                return_exceptions=True,
+            )
+
+        if isinstance(base_data_response, Exception):
+            base_data_response = _failed_response(base_data_response)
+
+        if isinstance(energy_data_response, Exception):
+            LOGGER.warning(
+                "Failed getting energy data for %s: %r", device_id, energy_data_response
+            )
+            energy_data_response = None
+
+        return base_data_response, energy_data_response
+
+    async def async_refresh_device(self, device: EquationDevice) -> bool:
+        """Fetch the current cloud state of a single device.
+
+        Unlike a coordinator refresh, this is not debounced, so it can confirm
+        a command right after it was sent. The energy data is kept as is.
+        """
+
+        try:
+            async with self._fetch_semaphore, asyncio.timeout(DEVICE_FETCH_TIMEOUT):
+                response = await self.async_api.async_get_device(device.id)
+        except TimeoutError as err:
+            response = _failed_response(err)
+
+        if not response.success:
+            LOGGER.warning(
+                "Failed refreshing device %s. Error: %s",
+                device.id,
+                response.error_message,
+            )
+            return False
+
+        if self._fw_map_cache:
+            latest_fw = determine_latest_firmware(response.data, self._fw_map_cache[1])
+        else:
+            latest_fw = None
+
+        self._add_or_update_device(
+            response.data, device.energy_data, device.id, latest_fw
+        )
+
+        return True
+
     async def _process_api_data(
         self,
         base_data_response: ApiResponse,
         device_id: str,
-        energy_data_response: ApiResponse,
+        energy_data_response: ApiResponse | None,
         firmware_map: dict[EquationProduct, dict[str, str]] | None,
     ) -> EquationDevice | None:
         """Process the data related to a single device."""
 
-        LOGGER.debug("Processing data for device ID: %s", device_id)
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Processing data for device ID: %s", device_id)
 
         if base_data_response.success:
             base_data = base_data_response.data
@@ -212,7 +374,7 @@ class EquationDeviceManager:
 
             return None
 
-        if energy_data_response.success:
+        if energy_data_response and energy_data_response.success:
             energy_data = energy_data_response.data
         else:
             energy_data = None
@@ -240,48 +402,53 @@ class EquationDeviceManager:
         Return the device if it's new or None if it's an existing one.
         """
 
-        device_data_data = device_data.get("data", None)
+        data = device_data.get("data")
 
-        if not device_data_data:
+        if not data:
             LOGGER.error("Device ID %s has no valid data. Ignoring", device_id)
             return None
 
+        device_type = data.get("type")
+
+        if device_type not in EQUATION_SUPPORTED_DEVICES:
+            LOGGER.warning("Ignoring Equation device of type %s", device_type)
+            return None
+
+        debug_enabled = LOGGER.isEnabledFor(logging.DEBUG)
+
         # Existing device, update it.
         if device_id in self.equation_devices:
 
             target_device = self.equation_devices[device_id]
 
             if not target_device.hass_available:
-                LOGGER.debug("Restoring device %s", target_device.name)
+                if debug_enabled:
+                    LOGGER.debug("Restoring device %s", target_device.name)
                 target_device.hass_available = True
 
             target_device.update_data(device_data, energy_stats, latest_fw)
 
-            LOGGER.debug(
-                "Updating existing device [%s]",
-                device_data_data.get("name", "N/A"),
-            )
+            if debug_enabled:
+                LOGGER.debug(
+                    "Updating existing device [%s]",
+                    data.get("name", "N/A"),
+                )
 
             return None
 
         # New device.
-        device_type = device_data["data"]["type"]
-
-        if device_type not in EQUATION_SUPPORTED_DEVICES:
-            LOGGER.warning("Ignoring Equation device of type %s", device_type)
-            return None
-
-        firmware_data = device_data.get("firmware", None)
-        LOGGER.debug(
-            "Found new device %s [%s] - %s. FW: %s - %s",
-            device_data_data.get("name", "N/A"),
-            device_data_data.get("type", "N/A"),
-            device_data_data.get("product_version", "N/A"),
-            firmware_data.get("firmware_version_device", "N/A")
-            if firmware_data
-            else "N/A",
-            device_data,
-        )
+        if debug_enabled:
+            firmware_data = device_data.get("firmware", None)
+            LOGGER.debug(
+                "Found new device %s [%s] - %s. FW: %s - %s",
+                data.get("name", "N/A"),
+                device_type,
+                data.get("product_version", "N/A"),
+                firmware_data.get("firmware_version_device", "N/A")
+                if firmware_data
+                else "N/A",
+                device_data,
+            )
 
         equation_device = EquationDevice(
             device_info=device_data,
@@ -292,19 +459,25 @@ class EquationDeviceManager:
 
         return equation_device
 
-    async def send_command(self, device: EquationDevice, command: str, arg) -> bool:
-        """Send command to the device."""
+    async def send_command(
+        self, device: EquationDevice, command: str, arg, force: bool = False
+    ) -> bool:
+        """Send command to the device.
+
+        Hvac mode commands matching the device model are skipped, unless forced.
+        """
 
         LOGGER.debug("Sending command [%s] to device ID [%s]", command, device.id)
 
-        if command == CMD_SET_TEMP:
-            return await self._set_device_temp(device, arg)
+        async with self._command_semaphore:
+            if command == CMD_SET_TEMP:
+                return await self._set_device_temp(device, arg)
 
-        if command == CMD_SET_PRESET:
-            return await self._set_device_preset(device, arg)
+            if command == CMD_SET_PRESET:
+                return await self._set_device_preset(device, arg)
 
-        if command == CMD_SET_HVAC_MODE:
-            return await self._set_device_mode(device, arg)
+            if command == CMD_SET_HVAC_MODE:
+                return await self._set_device_mode(device, arg, force)
 
         LOGGER.warning("Ignoring unsupported command: %s", command)
         return False
@@ -312,8 +485,15 @@ class EquationDeviceManager:
     async def _set_device_temp(self, device: EquationDevice, new_temp: float) -> bool:
         """Set device temperature."""
 
+        if (
+            device.power
+            and device.mode == RADIATOR_MODE_MANUAL
+            and isclose(device.temp, new_temp, abs_tol=TEMP_TOLERANCE)
+        ):
+            return True
+
         result: ApiResponse = await self.hass.async_add_executor_job(
-            self.equation_api.set_device_temp, device, new_temp
+            self._api_set_device_temp, device, new_temp
         )
 
         if not result.success:
@@ -326,22 +506,26 @@ class EquationDeviceManager:
         device.mode = RADIATOR_MODE_MANUAL
         device.power = True
 
-        if new_temp == device.comfort_temp:
-            device.preset = RADIATOR_PRESET_COMFORT
-        elif new_temp == device.eco_temp:
-            device.preset = RADIATOR_PRESET_ECO
-        elif new_temp == device.ice_temp:
-            device.preset = RADIATOR_PRESET_ICE
-        else:
-            device.preset = RADIATOR_PRESET_NONE
+        # Later keys win, so comfort takes precedence over eco, and eco over ice.
+        preset_map = {
+            round(device.ice_temp, 1): RADIATOR_PRESET_ICE,
+            round(device.eco_temp, 1): RADIATOR_PRESET_ECO,
+            round(device.comfort_temp, 1): RADIATOR_PRESET_COMFORT,
+        }
+        device.preset = preset_map.get(round(new_temp, 1), RADIATOR_PRESET_NONE)
 
         return True
 
-    async def _set_device_mode(self, device: EquationDevice, hvac_mode: str) -> bool:
+    async def _set_device_mode(
+        self, device: EquationDevice, hvac_mode: str, force: bool = False
+    ) -> bool:
         """Set the device hvac mode."""
 
+        if not force and _is_hvac_mode_active(device, hvac_mode):
+            return True
+
         result = await self.hass.async_add_executor_job(
-            self.equation_api.set_device_mode, device, hvac_mode
+            self._api_set_device_mode, device, hvac_mode
         )
 
         if not result.success:
@@ -405,8 +589,15 @@ class EquationDeviceManager:
             device_mode = RADIATOR_MODE_MANUAL
             device_preset = RADIATOR_PRESET_ICE
 
+        if (
+            device.preset == device_preset
+            and device.mode == device_mode
+            and device.power == device_power
+        ):
+            return True
+
         result = await self.hass.async_add_executor_job(
-            self.equation_api.set_device_preset, device, device_preset
+            self._api_set_device_preset, device, device_preset
         )
 
         if not result.success:
@@ -12,6 +12,8 @@ from .device_manager import EquationDevice, EquationDeviceManager
 class EquationHAEntity(CoordinatorEntity):
     """Equation entity base class."""
 
+    __slots__ = ()
+
     def __init__(
         self, coordinator: EquationDataUpdateCoordinator, name: str, unique_id: str
     ) -> None:
@@ -29,6 +31,8 @@ class EquationHAEntity(CoordinatorEntity):
 class EquationRadiatorEntity(EquationHAEntity):
     """Base class for entities that support a Radiator device (climate and sensors)."""
 
+    __slots__ = ("_radiator",)
+
     def __init__(
         self,
         coordinator: EquationDataUpdateCoordinator,
@@ -40,24 +44,21 @@ class EquationRadiatorEntity(EquationHAEntity):
         super().__init__(coordinator, name, unique_id)
         self._radiator = radiator
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return a device description for device registry."""
-
-        if self._radiator.equation_product:
-            product_name = self._radiator.equation_product.product_name
+        if radiator.equation_product:
+            product_name = radiator.equation_product.product_name
         else:
             product_name = (
-                f"{self._radiator.type.capitalize()} {self._radiator.product_version.capitalize()}",
+                f"{radiator.type.capitalize()} {radiator.product_version.capitalize()}"
             )
 
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._radiator.id)},
+        # Firmware changes are pushed to the device registry by the coordinator.
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, radiator.id)},
             manufacturer=EQUATION_MANUFACTURER,
-            name=self._radiator.name,
+            name=radiator.name,
             model=product_name,
-            sw_version=self._radiator.firmware_version,
-            serial_number=self._radiator.serialnumber,
+            sw_version=radiator.firmware_version,
+            serial_number=radiator.serialnumber,
         )
 
     @property
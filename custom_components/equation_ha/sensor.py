@@ -1,21 +1,21 @@
 """A sensor for the current Equation radiator temperature."""
 from __future__ import annotations
 
-from datetime import datetime
-
 from equationsdk.device import EquationDevice
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.typing import StateType
 
 from .const import DOMAIN
 from .coordinator import EquationDataUpdateCoordinator
 from .equation_entity import EquationRadiatorEntity
 from .sensor_descriptions import SENSOR_DESCRIPTIONS, EquationSensorEntityDescription
 
+# Sensors whose values come from the device energy data.
+ENERGY_SENSOR_KEYS = {"energy", "power"}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -33,6 +33,8 @@ async def async_setup_entry(
 class EquationGenericSensor(EquationRadiatorEntity, SensorEntity):
     """Generic radiator sensor."""
 
+    __slots__ = ("entity_description",)
+
     entity_description: EquationSensorEntityDescription
 
     def __init__(
@@ -50,13 +52,27 @@ class EquationGenericSensor(EquationRadiatorEntity, SensorEntity):
         )
 
         self.entity_description = description
+        self._update_attrs()
+
+    async def async_added_to_hass(self) -> None:
+        """Request energy data from the coordinator when this sensor needs it."""
+        await super().async_added_to_hass()
+
+        if self.entity_description.key in ENERGY_SENSOR_KEYS:
+            self.async_on_remove(
+                self.coordinator.async_enable_energy_data(
+                    self._radiator.id, self.entity_description.key
+                )
+            )
 
-    @property
-    def native_value(self) -> StateType:
-        """Return the sensor value."""
-        return self.entity_description.value_fn(self._radiator)
+    @callback
+    def _update_attrs(self) -> None:
+        """Compute the cached sensor value from the radiator state."""
+        self._attr_native_value = self.entity_description.value_fn(self._radiator)
+        self._attr_last_reset = self.entity_description.last_reset_fn(self._radiator)
 
-    @property
-    def last_reset(self) -> datetime | None:
-        """Return the last time the sensor was initialized, if relevant."""
-        return self.entity_description.last_reset_fn(self._radiator)
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_attrs()
+        self.async_write_ha_state()
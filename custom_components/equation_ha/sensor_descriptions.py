@@ -4,6 +4,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
+from operator import attrgetter
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -33,7 +34,27 @@ class EquationSensorEntityDescription(
     """Define an object to describe Equation sensor entities."""
 
 
-SENSOR_DESCRIPTIONS = [
+def _energy_kwh(radiator: EquationDevice) -> float | None:
+    """Return the consumed energy, if known."""
+    return radiator.energy_data.kwh if radiator.energy_data else None
+
+
+def _energy_start(radiator: EquationDevice) -> datetime | None:
+    """Return the start of the energy measurement period, if known."""
+    return radiator.energy_data.start if radiator.energy_data else None
+
+
+def _energy_effective_power(radiator: EquationDevice) -> float | None:
+    """Return the effective power, if known."""
+    return radiator.energy_data.effective_power if radiator.energy_data else None
+
+
+def _no_last_reset(radiator: EquationDevice) -> None:
+    """Return no last reset, for sensors that are not totals."""
+    return None
+
+
+SENSOR_DESCRIPTIONS = (
     # Current room temperature sensor (probe value).
     EquationSensorEntityDescription(
         key="current_temperature",
@@ -41,16 +62,16 @@ SENSOR_DESCRIPTIONS = [
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda radiator: radiator.temp_probe,
-        last_reset_fn=lambda radiator: None,
+        value_fn=attrgetter("temp_probe"),
+        last_reset_fn=_no_last_reset,
     ),
     # Window open sensor.
     EquationSensorEntityDescription(
         key="window_open",
         name="Window Open",
         device_class=BinarySensorDeviceClass.WINDOW,
-        value_fn=lambda radiator: radiator.windows_open_status,
-        last_reset_fn=lambda radiator: None,
+        value_fn=attrgetter("windows_open_status"),
+        last_reset_fn=_no_last_reset,
     ),
     # Energy usage in Kw/h.
     EquationSensorEntityDescription(
@@ -60,12 +81,8 @@ SENSOR_DESCRIPTIONS = [
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         state_class=SensorStateClass.TOTAL,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda radiator: radiator.energy_data.kwh
-        if radiator.energy_data
-        else None,
-        last_reset_fn=lambda radiator: radiator.energy_data.start
-        if radiator.energy_data
-        else None,
+        value_fn=_energy_kwh,
+        last_reset_fn=_energy_start,
     ),
     # Effective power usage in W.
     EquationSensorEntityDescription(
@@ -75,9 +92,7 @@ SENSOR_DESCRIPTIONS = [
         native_unit_of_measurement=UnitOfPower.WATT,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda radiator: radiator.energy_data.effective_power
-        if radiator.energy_data
-        else None,
-        last_reset_fn=lambda radiator: None,
+        value_fn=_energy_effective_power,
+        last_reset_fn=_no_last_reset,
     ),
-]
+)